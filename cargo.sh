@@ -3,6 +3,9 @@
 # This script manages Cargo operations
 # while keeping the artifact directory within the build tree
 # instead of the source tree
+#
+# cargo_build.py replicates this setup for builds,
+# keep them in sync
 
 set -e
 
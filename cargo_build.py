@@ -5,45 +5,49 @@ while keeping the artifact directory within the build tree
 instead of the source tree.
 """
 
-from pathlib import Path
+import os
 import shlex
+import shutil
 import subprocess
 import sys
 
-source_dir = Path(__file__).absolute().parent
+source_dir = os.path.dirname(os.path.abspath(__file__))
 
-args = sys.argv[1:]
 binary_dir = "debug"
-
-if '--release' in args:
-    binary_dir = "release"
-
 # The file produced by Cargo will have a special name
-try:
-    i = args.index('--rename')
-except ValueError:
-    filename = None
-else:
-    args.pop(i)
-    filename = args.pop(i)
-
+filename = None
 # The target destination of the produced file is a positional argument
-out_path = [arg for arg in args if not arg.startswith('--')]
-if out_path:
-    out_path = out_path[0]
-    i = args.index(out_path)
-    args.pop(i)    
-
-subprocess.run(['sh', "{}/cargo.sh".format(source_dir.as_posix()), 'build']
+out_path = None
+args = []
+
+argv = iter(sys.argv[1:])
+for arg in argv:
+    if arg == '--rename':
+        filename = next(argv)
+    elif arg.startswith('--'):
+        if arg == '--release':
+            binary_dir = "release"
+        args.append(arg)
+    elif out_path is None:
+        out_path = arg
+    else:
+        args.append(arg)
+
+# Same as `cargo.sh build`, without the intermediate shell
+target_dir = os.getcwd()
+env = dict(os.environ, CARGO_TARGET_DIR=target_dir)
+
+subprocess.run(['cargo', 'build',
+        '--manifest-path', f"{target_dir}/Cargo.toml"]
     + args,
+    env=env,
+    cwd=source_dir,
     check=True)
 
 if out_path:
-    out_path = Path(out_path).absolute()
-    out_basename = out_path.name
-    filename = filename or out_basename
-    subprocess.run(['cp', '-a',
-        './{}/{}'.format(binary_dir, filename),
-        out_path],
-        check=True)
+    out_path = os.path.abspath(out_path)
+    filename = filename or os.path.basename(out_path)
+    # copy2 preserves mode and timestamps like `cp -a`,
+    # and uses in-kernel copying where available.
+    shutil.copy2('./{}/{}'.format(binary_dir, filename), out_path)
 
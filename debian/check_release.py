@@ -5,7 +5,11 @@ Feed it the first changelog line, and then all available tags.
 """
 
 import re, sys
-version = re.findall("\\((.*)\\)", input())[0]
-tag = 'v' + re.findall("([0-9]+\\.[0-9]+\\.[0-9]+).*", version)[0]
-if tag not in map(str.strip, sys.stdin.readlines()):
+
+VERSION = re.compile("\\((.*)\\)")
+TAG_VERSION = re.compile("([0-9]+\\.[0-9]+\\.[0-9]+)")
+
+version = VERSION.search(input()).group(1)
+tag = 'v' + TAG_VERSION.search(version).group(1)
+if not any(line.strip() == tag for line in sys.stdin):
     raise Exception("Changelog's current version doesn't have a tag. Push the tag!")
@@ -10,10 +10,10 @@ from gi.repository import Gtk
 from gi.repository import GLib
 
 try:
-    terminal = [("Terminal", Gtk.InputPurpose.TERMINAL)]
+    terminal = (("Terminal", Gtk.InputPurpose.TERMINAL),)
 except AttributeError:
     print("Terminal purpose not available on this GTK version", file=sys.stderr)
-    terminal = []
+    terminal = ()
 
 def new_grid(items, set_type):
     grid = Gtk.Grid(orientation='vertical', column_spacing=8, row_spacing=8)
@@ -32,7 +32,7 @@ def new_grid(items, set_type):
 
 class App(Gtk.Application):
 
-    purposes = [
+    purposes = (
         ("Free form", Gtk.InputPurpose.FREE_FORM),
         ("Alphabetical", Gtk.InputPurpose.ALPHA),
         ("Digits", Gtk.InputPurpose.DIGITS),
@@ -43,29 +43,32 @@ class App(Gtk.Application):
         ("Name", Gtk.InputPurpose.NAME),
         ("Password", Gtk.InputPurpose.PASSWORD),
         ("PIN", Gtk.InputPurpose.PIN),
-    ] + terminal
+    ) + terminal
 
-    hints = [
+    hints = (
         ("OSK provided", Gtk.InputHints.INHIBIT_OSK),
         ("Uppercase chars", Gtk.InputHints.UPPERCASE_CHARS),
-    ]
+    )
 
-    purpose_timer = 0;
+    purpose_timer = 0
 
     def on_purpose_toggled(self, btn, entry):
         purpose = Gtk.InputPurpose.PIN if btn.get_active() else Gtk.InputPurpose.PASSWORD
         entry.set_input_purpose(purpose)
 
     def on_timeout(self, e):
-        r = random.randint(0, len(self.purposes) - 1)
-        (_, purpose) = self.purposes[r]
+        (_, purpose) = random.choice(self.purposes)
         print(f"Setting {purpose}")
         e.set_input_purpose(purpose)
-        return True
+        return GLib.SOURCE_CONTINUE
 
     def on_is_focus_changed(self, e, *args):
-        if not self.purpose_timer and e.props.is_focus:
-            GLib.timeout_add_seconds (3, self.on_timeout, e)
+        if e.props.is_focus:
+            if not self.purpose_timer:
+                self.purpose_timer = GLib.timeout_add_seconds(3, self.on_timeout, e)
+        elif self.purpose_timer:
+            GLib.source_remove(self.purpose_timer)
+            self.purpose_timer = 0
 
     def add_random (self, grid):
         l = Gtk.Label(label="Random")
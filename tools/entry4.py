@@ -30,7 +30,7 @@ def new_grid(items, set_type):
 
 class App(Gtk.Application):
 
-    purposes = [
+    purposes = (
         ("Free form", Gtk.InputPurpose.FREE_FORM),
         ("Alphabetical", Gtk.InputPurpose.ALPHA),
         ("Digits", Gtk.InputPurpose.DIGITS),
@@ -42,11 +42,11 @@ class App(Gtk.Application):
         ("Password", Gtk.InputPurpose.PASSWORD),
         ("PIN", Gtk.InputPurpose.PIN),
         ("Terminal", Gtk.InputPurpose.TERMINAL),
-    ]
+    )
 
-    hints = [
-        ("OSK provided", Gtk.InputHints.INHIBIT_OSK)
-    ]
+    hints = (
+        ("OSK provided", Gtk.InputHints.INHIBIT_OSK),
+    )
     purpose_tick_id = 0
 
     def on_purpose_toggled(self, btn, entry):
@@ -54,11 +54,10 @@ class App(Gtk.Application):
         entry.set_input_purpose(purpose)
 
     def on_timeout(self, e):
-        r = random.randint(0, len(self.purposes) - 1)
-        (_, purpose) = self.purposes[r]
+        (_, purpose) = random.choice(self.purposes)
         print(f"Setting {purpose}")
         e.set_input_purpose(purpose)
-        return True
+        return GLib.SOURCE_CONTINUE
 
     def on_random_enter(self, controller, entry):
         self.purpose_tick_id = GLib.timeout_add_seconds(3, self.on_timeout, entry)